@@ -1,6 +1,68 @@
 import csv
+import mmap
 import os
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, namedtuple
+from functools import cache
+from operator import attrgetter
+
+ColumnStats = namedtuple(
+    "ColumnStats", ("count", "total", "minimum", "maximum")
+)
+
+
+def _min(stats):
+    if not stats.count:
+        raise ValueError("MIN не определен для пустого столбца!")
+    return stats.minimum
+
+
+def _max(stats):
+    if not stats.count:
+        raise ValueError("MAX не определен для пустого столбца!")
+    return stats.maximum
+
+
+def _avg(stats):
+    return stats.total / stats.count
+
+
+AGGREGATE_FUNCTIONS = {
+    "COUNT": attrgetter("count"),
+    "SUM": attrgetter("total"),
+    "MIN": _min,
+    "MAX": _max,
+    "AVG": _avg,
+}
+
+
+def _make_coerce(attrs, attrs_types):
+    """Генерирует функцию приведения строки значений к типам полей."""
+    # Для ("id", "name") и {"id": int} получается:
+    #     def coerce(values):
+    #         f0, f1, = values
+    #         return (t0(f0), f1,)
+    names = [f"f{i}" for i in range(len(attrs))]
+    namespace = {}
+    items = []
+
+    for i, (attr, name) in enumerate(zip(attrs, names)):
+        attr_type = attrs_types.get(attr)
+        if attr_type is None:
+            items.append(name)
+        else:
+            namespace[f"t{i}"] = attr_type
+            items.append(f"t{i}({name})")
+
+    source = (
+        "def coerce(values):\n"
+        f"    {', '.join(names)}, = values\n"
+        f"    return ({', '.join(items)},)\n"
+    )
+    exec(source, namespace)
+    return namespace["coerce"]
 
 
 class SingletonMeta(type):
@@ -9,9 +71,11 @@ class SingletonMeta(type):
     _instances = {}
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is None:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return instance
 
 
 class Database(metaclass=SingletonMeta):
@@ -30,6 +94,13 @@ class Database(metaclass=SingletonMeta):
         else:
             raise ValueError(f"Таблица '{table_name}' не существует!")
 
+    def insert_many(self, table_name, rows):
+        table = self.tables.get(table_name)
+        if table:
+            table.insert_many(rows)
+        else:
+            raise ValueError(f"Таблица '{table_name}' не существует!")
+
     def select(self, table_name, *args):
         table = self.tables.get(table_name)
         return table.select(*args) if table else None
@@ -41,58 +112,86 @@ class Database(metaclass=SingletonMeta):
             if not value:
                 raise ValueError(f"Таблица '{key}' не существует!")
 
+        attr_sets = {
+            name: frozenset(table.ATTRS) for name, table in table_objs.items()
+        }
         join_attrs = []
 
         for pair in attrs:
             for line in pair:
-                table, attr = line.split(".")
+                table, dot, attr = line.partition(".")
 
-                if table not in table_objs:
+                if not dot:
+                    raise ValueError(
+                        f"Поле '{line}' должно быть задано как 'таблица.поле'!"
+                    )
+
+                if table not in attr_sets:
                     raise ValueError(f"Таблица '{table}' не существует!")
 
-                if attr not in table_objs[table].ATTRS:
+                if attr not in attr_sets[table]:
                     raise ValueError(
                         f"Таблица '{table}' не содержит поле '{attr}'!"
                     )
 
                 join_attrs.append((table, attr))
 
-        def prepare_data(table_name, table_data):
-            new_data = [
-                {f"{table_name}.{key}": value for key, value in row.items()}
-                for row in table_data
-            ]
-            return new_data
-
-        def join_two_tables(data1, data2, key1, key2):
-            joined_rows = []
-
-            for row1 in data1:
+        # Промежуточные строки хранятся кортежами значений, словари с
+        # полными именами полей собираются один раз для итогового результата.
+        def join_two_tables(data1, data2, index1, index2):
+            # Hash join: хеш-таблица строится по меньшей из таблиц,
+            # вторая таблица проходится один раз.
+            if len(data2) <= len(data1):
+                hash_table = defaultdict(list)
                 for row2 in data2:
-                    if row1[key1] == row2[key2]:
-                        joined_rows.append({**row1, **row2})
-
-            return joined_rows
-
+                    hash_table[row2[index2]].append(row2)
+
+                return [
+                    row1 + row2
+                    for row1 in data1
+                    for row2 in hash_table.get(row1[index1], ())
+                ]
+
+            hash_table = defaultdict(list)
+            for i, row1 in enumerate(data1):
+                hash_table[row1[index1]].append((i, row1))
+
+            # Совпадения раскладываются по строкам data1, чтобы сохранить
+            # порядок вложенного цикла по data1 без сортировки.
+            buckets = [[] for _ in data1]
+            for row2 in data2:
+                for i, row1 in hash_table.get(row2[index2], ()):
+                    buckets[i].append(row1 + row2)
+
+            return [row for bucket in buckets for row in bucket]
+
+        # Значения каждой таблицы выбираются один раз, даже если она
+        # участвует в нескольких соединениях.
+        prepared = {
+            name: list(table.row_values())
+            for name, table in table_objs.items()
+        }
         result = []
+        keys = ()
 
         for i in range(0, len(join_attrs) - 1, 2):
             table1, attr1 = join_attrs[i]
             table2, attr2 = join_attrs[i + 1]
-            data2 = prepare_data(table2, table_objs[table2].data)
 
             if i == 0:
-                data1 = prepare_data(table1, table_objs[table1].data)
-                result = join_two_tables(
-                    data1, data2, f"{table1}.{attr1}", f"{table2}.{attr2}"
-                )
+                result = prepared[table1]
+                keys = table_objs[table1].qualified_keys(table1)
 
-            else:
-                result = join_two_tables(
-                    result, data2, f"{table1}.{attr1}", f"{table2}.{attr2}"
-                )
+            table2_keys = table_objs[table2].qualified_keys(table2)
+            result = join_two_tables(
+                result,
+                prepared[table2],
+                keys.index(f"{table1}.{attr1}"),
+                table2_keys.index(f"{table2}.{attr2}"),
+            )
+            keys += table2_keys
 
-        return result
+        return [dict(zip(keys, values)) for values in result]
 
     def aggregate(self, table_name, column, function_name):
         table = self.tables.get(table_name)
@@ -103,129 +202,325 @@ class Database(metaclass=SingletonMeta):
         if column not in table.ATTRS:
             raise ValueError(f"Таблица '{table}' не содержит поле '{column}'!")
 
-        match function_name.upper():
-            case "COUNT":
-                aggregate_function = len
-            case "SUM":
-                aggregate_function = sum
-            case "MIN":
-                aggregate_function = min
-            case "MAX":
-                aggregate_function = max
-            case "AVG":
-                aggregate_function = lambda x: sum(x) / len(x)
-            case _:
-                raise ValueError(
-                    f"Функция '{function_name}' не является агрегатной!"
-                )
+        aggregate_function = AGGREGATE_FUNCTIONS.get(function_name.upper())
+        if aggregate_function is None:
+            raise ValueError(
+                f"Функция '{function_name}' не является агрегатной!"
+            )
 
-        return aggregate_function([int(row[column]) for row in table.data])
+        return aggregate_function(table.column_stats(column))
 
 
 class Table(ABC):
     """Абстрактный базовый класс для таблиц с вводом/выводом файлов CSV."""
 
     ATTRS = tuple()
+    ATTRS_TYPES = {}
     FILE_PATH = ""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.ATTRS:
+            cls._id_position = cls.ATTRS.index("id")
+            cls._int_positions = tuple(
+                i
+                for i, attr in enumerate(cls.ATTRS)
+                if cls.ATTRS_TYPES.get(attr) is int
+            )
+            cls._coerce = staticmethod(
+                _make_coerce(cls.ATTRS, cls.ATTRS_TYPES)
+            )
+
     def __init__(self):
-        self.data = []
+        # Данные хранятся по столбцам: имя поля -> список значений.
+        # Строки-словари собираются только при выдаче результата.
+        self.columns = {}
         self.load()
 
-    @abstractmethod
-    def insert(self, data):
-        pass  # pragma: no cover
-
     @abstractmethod
     def select(self, *args):
         pass  # pragma: no cover
 
+    def insert(self, data):
+        self.insert_many([data])
+
+    def insert_many(self, rows):
+        pending = {}
+
+        for data in rows:
+            # Запятая в последнем куске означает лишние поля в строке.
+            parts = data.split(",", len(self.ATTRS) - 1)
+            if len(parts) != len(self.ATTRS) or "," in parts[-1]:
+                raise ValueError(
+                    f"Строка '{data}' должна содержать "
+                    f"{len(self.ATTRS)} полей через запятую!"
+                )
+            values = self._coerce(parts)
+            # Проверка диапазона int64 до вставки: иначе array("q")
+            # упадет посреди _append и столбцы разойдутся по длине.
+            try:
+                array("q", [values[i] for i in self._int_positions])
+            except OverflowError:
+                raise ValueError(
+                    f"Строка '{data}' содержит значение вне диапазона int64!"
+                ) from None
+            id_ = values[self._id_position]
+
+            existing = pending.get(id_)
+            if existing is not None:
+                existing = dict(zip(self.ATTRS, existing))
+            elif id_ in self._id_index:
+                existing = self.row(self._id_index[id_])
+            if existing is not None:
+                self._raise_duplicate(dict(zip(self.ATTRS, values)), existing)
+
+            pending[id_] = values
+
+        new_rows = list(pending.values())
+        for values in new_rows:
+            self._append(values)
+        self._clear_caches()
+        self.append_rows(new_rows)
+
+    def _raise_duplicate(self, entry, existing):
+        raise ValueError("Поле 'id' должно быть уникальным!")
+
+    @property
+    def row_count(self):
+        return len(self.columns["id"])
+
+    @property
+    def rows(self):
+        return [self.row(index) for index in range(self.row_count)]
+
+    def row(self, index):
+        return {attr: self.columns[attr][index] for attr in self.ATTRS}
+
+    @classmethod
+    @cache
+    def qualified_keys(cls, table_name):
+        return tuple(f"{table_name}.{attr}" for attr in cls.ATTRS)
+
+    def row_values(self):
+        return zip(*(self.columns[attr] for attr in self.ATTRS))
+
     def save(self):
-        with open(self.FILE_PATH, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=self.ATTRS)
-            writer.writeheader()
-            writer.writerows(self.data)
+        with open(self.FILE_PATH, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.ATTRS)
+            writer.writerows(self.row_values())
+
+    def append_rows(self, rows):
+        path = self.FILE_PATH
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+
+        with open(path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if is_new:
+                writer.writerow(self.ATTRS)
+            writer.writerows(rows)
 
     def load(self):
-        if os.path.exists(self.FILE_PATH):
-            with open(self.FILE_PATH, "r") as f:
-                reader = csv.DictReader(f)
-                self.data = [row for row in reader]
+        self.columns = {attr: self._new_column(attr) for attr in self.ATTRS}
+        self._id_index = {}
+        # Отсортированные id и соответствующие им номера строк (int64).
+        self._sorted_ids = array("q")
+        self._sorted_positions = array("q")
+        self._clear_caches()
+
+        if not os.path.exists(self.FILE_PATH):
+            return
+
+        with open(self.FILE_PATH, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+
+            # Без кавычек строки файла разбираются напрямую по запятым,
+            # иначе разбор поручается csv.reader.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'"') == -1:
+                    self._load_text(mm[:].decode("utf-8"))
+                    return
+
+        with open(self.FILE_PATH, "r", newline="", encoding="utf-8") as f:
+            self._load_rows(csv.reader(f))
+
+    def _load_text(self, text):
+        # Быстрый путь для файлов без кавычек: все строки склеиваются и
+        # режутся по запятым одним split, столбцы берутся срезами.
+        lines = text.splitlines()
+        body = [line for line in lines[1:] if line]
+        size = len(self.ATTRS)
+
+        if tuple(lines[0].split(",")) != self.ATTRS or any(
+            line.count(",") != size - 1 for line in body
+        ):
+            # Ошибку формата ищем построчным разбором, чтобы сообщить
+            # номер строки.
+            self._load_rows(
+                iter([line.split(",") if line else [] for line in lines])
+            )
         else:
-            self.data = []
+            fields = ",".join(body).split(",") if body else []
+            self._fill_columns(
+                (
+                    map(self.ATTRS_TYPES[attr], fields[i::size])
+                    if attr in self.ATTRS_TYPES
+                    else fields[i::size]
+                )
+                for i, attr in enumerate(self.ATTRS)
+            )
+
+    def _load_rows(self, rows):
+        if tuple(next(rows)) != self.ATTRS:
+            raise ValueError(
+                f"Заголовок файла '{self.FILE_PATH}' "
+                "не совпадает с полями таблицы!"
+            )
+
+        # Общий путь для файлов с кавычками и некорректных файлов: строки
+        # разбирает csv.reader, типы приводятся построчно, колонки
+        # заполняются одним проходом в _fill.
+        loaded = []
+        for line_num, values in enumerate(rows, start=2):
+            if not values:
+                continue
+            if len(values) != len(self.ATTRS):
+                raise ValueError(
+                    f"Строка {line_num} файла '{self.FILE_PATH}' "
+                    "содержит неверное число полей!"
+                )
+            loaded.append(self._coerce(values))
+
+        self._fill(loaded)
+
+    def _new_column(self, attr):
+        # Целочисленные столбцы хранятся компактным массивом int64.
+        return array("q") if self.ATTRS_TYPES.get(attr) is int else []
+
+    def _append(self, values):
+        position = self.row_count
+        for attr, value in zip(self.ATTRS, values):
+            self.columns[attr].append(value)
+
+        id_ = self.columns["id"][position]
+        self._id_index[id_] = position
+
+        index = bisect_right(self._sorted_ids, id_)
+        self._sorted_ids.insert(index, id_)
+        self._sorted_positions.insert(index, position)
+
+    def _fill(self, rows):
+        self._fill_columns(zip(*rows))
+
+    def _fill_columns(self, column_values):
+        # Массовая загрузка: каждый столбец заполняется одним extend,
+        # индексы строятся один раз, а не по строке. Столбцы заменяются
+        # только после успешного заполнения всех.
+        columns = {attr: self._new_column(attr) for attr in self.ATTRS}
+        try:
+            for attr, values in zip(self.ATTRS, column_values):
+                columns[attr].extend(values)
+        except OverflowError:
+            raise ValueError(
+                f"Файл '{self.FILE_PATH}' содержит значение "
+                "вне диапазона int64!"
+            ) from None
+
+        self.columns = columns
+        self._build_indexes()
+
+    def _build_indexes(self):
+        ids = self.columns["id"]
+        self._id_index = {id_: position for position, id_ in enumerate(ids)}
+        order = sorted(range(len(ids)), key=ids.__getitem__)
+        self._sorted_ids = array("q", map(ids.__getitem__, order))
+        self._sorted_positions = array("q", order)
+
+    def _select_id_range(self, start_id, end_id):
+        lo = bisect_left(self._sorted_ids, start_id)
+        hi = bisect_right(self._sorted_ids, end_id)
+        return [self.row(index) for index in self._sorted_positions[lo:hi]]
+
+    def _clear_caches(self):
+        self._stats_cache = {}
+
+    def numeric_column(self, column):
+        if self.ATTRS_TYPES.get(column) is not int:
+            raise ValueError(f"Поле '{column}' не является числовым!")
+        return self.columns[column]
+
+    def column_stats(self, column):
+        stats = self._stats_cache.get(column)
+        if stats is None:
+            values = self.numeric_column(column)
+            total = 0
+            minimum = maximum = values[0] if values else None
+            # Сумма, минимум и максимум считаются за один проход.
+            for value in values:
+                total += value
+                if value < minimum:
+                    minimum = value
+                if value > maximum:
+                    maximum = value
+            stats = ColumnStats(len(values), total, minimum, maximum)
+            self._stats_cache[column] = stats
+        return stats
 
 
 class EmployeeTable(Table):
     """Таблица сотрудников с методами ввода-вывода из файла CSV."""
 
     ATTRS = ("id", "name", "age", "salary", "department_id")
+    ATTRS_TYPES = {"id": int, "age": int, "salary": int, "department_id": int}
     FILE_PATH = "employee_table.csv"
 
-    def insert(self, data):
-        entry = dict(zip(self.ATTRS, data.split(",")))
-
-        for row in self.data:
-            if row["id"] == entry["id"]:
-                if row["department_id"] == entry["department_id"]:
-                    raise ValueError(
-                        "Группа полей ('id', 'department_id') "
-                        "должна быть уникальной!"
-                    )
-                else:
-                    raise ValueError("Поле 'id' должно быть уникальным!")
-
-        self.data.append(entry)
-        self.save()
+    def _raise_duplicate(self, entry, existing):
+        if existing["department_id"] == entry["department_id"]:
+            raise ValueError(
+                "Группа полей ('id', 'department_id') "
+                "должна быть уникальной!"
+            )
+        else:
+            raise ValueError("Поле 'id' должно быть уникальным!")
 
     def select(self, start_id, end_id):
-        return [
-            entry
-            for entry in self.data
-            if start_id <= int(entry["id"]) <= end_id
-        ]
+        return self._select_id_range(start_id, end_id)
 
 
 class DepartmentTable(Table):
     """Таблица подразделений с вводом-выводом в/из CSV файла."""
 
     ATTRS = ("id", "department_name")
+    ATTRS_TYPES = {"id": int}
     FILE_PATH = "department_table.csv"
 
-    def select(self, department_name):
-        return [
-            entry
-            for entry in self.data
-            if entry["department_name"] == department_name
-        ]
+    def load(self):
+        # Индекс по названию подразделения: название -> номера строк.
+        self._by_name = {}
+        super().load()
 
-    def insert(self, data):
-        entry = dict(zip(self.ATTRS, data.split(",")))
+    def _append(self, values):
+        super()._append(values)
+        name = self.columns["department_name"][-1]
+        self._by_name.setdefault(name, []).append(self.row_count - 1)
 
-        for row in self.data:
-            if row["id"] == entry["id"]:
-                raise ValueError("Поле 'id' должно быть уникальным!")
+    def _build_indexes(self):
+        super()._build_indexes()
+        self._by_name = {}
+        for position, name in enumerate(self.columns["department_name"]):
+            self._by_name.setdefault(name, []).append(position)
 
-        self.data.append(entry)
-        self.save()
+    def select(self, department_name):
+        return [
+            self.row(index) for index in self._by_name.get(department_name, ())
+        ]
 
 
 class EmployeeLeaveTable(Table):
     ATTRS = ("id", "employee_id", "start_date", "end_date")
+    ATTRS_TYPES = {"id": int, "employee_id": int}
     FILE_PATH = "employee_leave_table.csv"
 
     def select(self, start_id, end_id):
-        return [
-            entry
-            for entry in self.data
-            if start_id <= int(entry["id"]) <= end_id
-        ]
-
-    def insert(self, data):
-        entry = dict(zip(self.ATTRS, data.split(",")))
-
-        for row in self.data:
-            if row["id"] == entry["id"]:
-                raise ValueError("Поле 'id' должно быть уникальным!")
-
-        self.data.append(entry)
-        self.save()
+        return self._select_id_range(start_id, end_id)
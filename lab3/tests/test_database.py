@@ -2,6 +2,7 @@ import os
 import tempfile
 
 import pytest
+
 from database.database import (
     Database,
     DepartmentTable,
@@ -54,6 +55,10 @@ def database(
     return db
 
 
+def test_database_is_singleton(database):
+    assert Database() is database
+
+
 def test_insert_employee(database):
     database.insert("employees", "1,Alice,30,70000,1")
 
@@ -61,11 +66,11 @@ def test_insert_employee(database):
     employee_data = database.select("employees", 1, 1)
     assert len(employee_data) == 1
     assert employee_data[0] == {
-        "id": "1",
+        "id": 1,
         "name": "Alice",
-        "age": "30",
-        "salary": "70000",
-        "department_id": "1",
+        "age": 30,
+        "salary": 70000,
+        "department_id": 1,
     }
 
     with pytest.raises(ValueError):
@@ -75,16 +80,39 @@ def test_insert_employee(database):
         database.insert("employees", "1,Bob,28,60000,2")
 
 
+def test_select_employees_by_id_range(database):
+    database.insert("employees", "3,Carol,35,90000,2")
+    database.insert("employees", "1,Alice,30,70000,1")
+    database.insert("employees", "5,Dave,41,120000,2")
+    database.insert("employees", "2,Bob,29,100000,1")
+
+    data = database.select("employees", 2, 4)
+    assert [row["name"] for row in data] == ["Bob", "Carol"]
+
+    assert database.select("employees", 6, 10) == []
+
+    database.tables["employees"].load()
+    data = database.select("employees", 2, 4)
+    assert [row["name"] for row in data] == ["Bob", "Carol"]
+
+
 def test_insert_department(database):
     database.insert("departments", "1,Engineering")
 
     data = database.select("departments", "Engineering")
     assert len(data) == 1
-    assert data[0] == {"id": "1", "department_name": "Engineering"}
+    assert data[0] == {"id": 1, "department_name": "Engineering"}
 
     with pytest.raises(ValueError):
         database.insert("departments", "1,Engineering")
 
+    database.insert("departments", "2,Marketing")
+    database.insert("departments", "3,Engineering")
+
+    data = database.select("departments", "Engineering")
+    assert [row["id"] for row in data] == [1, 3]
+    assert database.select("departments", "Sales") == []
+
 
 def test_insert_employee_leave(database):
     database.insert("employees_leaves", "1,1,01.06.2025,01.07.2025")
@@ -92,8 +120,8 @@ def test_insert_employee_leave(database):
     data = database.select("employees_leaves", 1, 1)
     assert len(data) == 1
     assert data[0] == {
-        "id": "1",
-        "employee_id": "1",
+        "id": 1,
+        "employee_id": 1,
         "start_date": "01.06.2025",
         "end_date": "01.07.2025",
     }
@@ -109,21 +137,21 @@ def test_join_employees_departments(database):
 
     expected_result = [
         {
-            "employees.id": "1",
+            "employees.id": 1,
             "employees.name": "Alice",
-            "employees.age": "30",
-            "employees.salary": "70000",
-            "employees.department_id": "1",
-            "departments.id": "1",
+            "employees.age": 30,
+            "employees.salary": 70000,
+            "employees.department_id": 1,
+            "departments.id": 1,
             "departments.department_name": "Engineering",
         },
         {
-            "employees.id": "2",
+            "employees.id": 2,
             "employees.name": "Bob",
-            "employees.age": "29",
-            "employees.salary": "100000",
-            "employees.department_id": "1",
-            "departments.id": "1",
+            "employees.age": 29,
+            "employees.salary": 100000,
+            "employees.department_id": 1,
+            "departments.id": 1,
             "departments.department_name": "Engineering",
         },
     ]
@@ -145,29 +173,29 @@ def test_join_employees_leaves_employees_departments(database):
 
     expected_result = [
         {
-            "employees_leaves.id": "1",
-            "employees_leaves.employee_id": "1",
+            "employees_leaves.id": 1,
+            "employees_leaves.employee_id": 1,
             "employees_leaves.start_date": "01.06.2025",
             "employees_leaves.end_date": "01.07.2025",
-            "employees.id": "1",
+            "employees.id": 1,
             "employees.name": "Alice",
-            "employees.age": "30",
-            "employees.salary": "70000",
-            "employees.department_id": "1",
-            "departments.id": "1",
+            "employees.age": 30,
+            "employees.salary": 70000,
+            "employees.department_id": 1,
+            "departments.id": 1,
             "departments.department_name": "Engineering",
         },
         {
-            "employees_leaves.id": "2",
-            "employees_leaves.employee_id": "2",
+            "employees_leaves.id": 2,
+            "employees_leaves.employee_id": 2,
             "employees_leaves.start_date": "10.09.2025",
             "employees_leaves.end_date": "24.09.2025",
-            "employees.id": "2",
+            "employees.id": 2,
             "employees.name": "Bob",
-            "employees.age": "29",
-            "employees.salary": "100000",
-            "employees.department_id": "1",
-            "departments.id": "1",
+            "employees.age": 29,
+            "employees.salary": 100000,
+            "employees.department_id": 1,
+            "departments.id": 1,
             "departments.department_name": "Engineering",
         },
     ]
@@ -184,6 +212,28 @@ def test_join_employees_leaves_employees_departments(database):
     assert result == expected_result
 
 
+def test_join_preserves_left_table_order(database):
+    database.insert("departments", "1,Engineering")
+    database.insert("departments", "2,Marketing")
+    database.insert("employees", "1,Alice,30,70000,2")
+    database.insert("employees", "2,Bob,29,100000,1")
+    database.insert("employees", "3,Carol,35,90000,2")
+
+    result = database.join(
+        ["departments", "employees"],
+        [("departments.id", "employees.department_id")],
+    )
+
+    assert [
+        (row["departments.department_name"], row["employees.name"])
+        for row in result
+    ] == [
+        ("Engineering", "Bob"),
+        ("Marketing", "Alice"),
+        ("Marketing", "Carol"),
+    ]
+
+
 def test_aggregate(database):
     database.insert("employees", "1,Alice,30,70000,1")
     database.insert("employees", "2,Bob,29,100000,1")
@@ -203,6 +253,16 @@ def test_aggregate(database):
     data = database.aggregate("employees", "salary", "AVG")
     assert data == 85000.0
 
+    database.insert("employees", "3,Carol,35,90000,2")
+
+    data = database.aggregate("employees", "salary", "SUM")
+    assert data == 260000
+
+    database.insert("employees", "4,Dave,41,50000,2")
+
+    data = database.aggregate("employees", "salary", "MIN")
+    assert data == 50000
+
     with pytest.raises(ValueError):
         database.aggregate("e", "salary", "COUNT")
 
@@ -212,12 +272,107 @@ def test_aggregate(database):
     with pytest.raises(ValueError):
         database.aggregate("employees", "salary", "ANY")
 
+    with pytest.raises(ValueError):
+        database.aggregate("employees", "name", "COUNT")
+
+
+def test_aggregate_empty_table(database):
+    assert database.aggregate("employees", "salary", "COUNT") == 0
+    assert database.aggregate("employees", "salary", "SUM") == 0
+
+    with pytest.raises(ValueError):
+        database.aggregate("employees", "salary", "MIN")
+
+    with pytest.raises(ValueError):
+        database.aggregate("employees", "salary", "MAX")
+
+    with pytest.raises(ZeroDivisionError):
+        database.aggregate("employees", "salary", "AVG")
+
+
+def test_insert_with_wrong_number_of_fields(database):
+    with pytest.raises(ValueError):
+        database.insert("employees", "1,Alice,30,70000")
+
+    with pytest.raises(ValueError):
+        database.insert("employees", "1,Alice,30,70000,1,2")
+
+    with pytest.raises(ValueError):
+        database.insert("departments", "1")
+
+    with pytest.raises(ValueError):
+        database.insert("departments", "1,Research, Development")
+
+    with pytest.raises(ValueError):
+        database.insert(
+            "employees_leaves", "1,1,01.06.2025,01.07.2025,garbage"
+        )
+
+    assert database.select("employees_leaves", 1, 1) == []
+
+    assert database.select("employees", 1, 1) == []
+
+
+def test_insert_with_out_of_range_value(database):
+    database.insert("employees", "1,Alice,30,70000,1")
+
+    with pytest.raises(ValueError):
+        database.insert("employees", "2,Bob,29,99999999999999999999,1")
+
+    with pytest.raises(ValueError):
+        database.insert_many(
+            "employees",
+            ["3,Carol,35,90000,2", "4,Dave,41,99999999999999999999,2"],
+        )
+
+    employee_table = database.tables["employees"]
+    assert [row["id"] for row in employee_table.rows] == [1]
+
+    database.insert("employees", "2,Bob,29,100000,1")
+    assert [row["name"] for row in database.select("employees", 1, 4)] == [
+        "Alice",
+        "Bob",
+    ]
+
+    employee_table.load()
+    assert [row["id"] for row in employee_table.rows] == [1, 2]
+
 
 def test_insert_into_not_existent_table(database):
     with pytest.raises(ValueError):
         database.insert("d", "1,Engineering")
 
 
+def test_insert_many(database):
+    database.insert_many(
+        "employees", ["1,Alice,30,70000,1", "2,Bob,29,100000,1"]
+    )
+    assert [row["name"] for row in database.select("employees", 1, 2)] == [
+        "Alice",
+        "Bob",
+    ]
+
+    # Пачка с повтором внутри себя не вставляется целиком
+    with pytest.raises(ValueError):
+        database.insert_many(
+            "employees", ["3,Carol,35,90000,2", "3,Dave,41,120000,2"]
+        )
+
+    with pytest.raises(ValueError):
+        database.insert_many(
+            "employees", ["4,Carol,35,90000,2", "1,Dave,41,120000,1"]
+        )
+
+    assert len(database.select("employees", 1, 10)) == 2
+
+    employee_table = database.tables["employees"]
+    employee_table.load()
+    assert len(employee_table.rows) == 2
+
+    with pytest.raises(ValueError):
+        database.insert_many("d", ["1,Engineering"])
+
+
 def test_join_with_incorrect_args(database):
     with pytest.raises(ValueError):
         database.join(
@@ -235,14 +390,97 @@ def test_join_with_incorrect_args(database):
             [("employees.department_id", "departments.department_id")],
         )
 
+    with pytest.raises(ValueError):
+        database.join(
+            ["employees", "departments"],
+            [("department_id", "departments.id")],
+        )
+
 
 def test_load_method(database):
     department_table = DepartmentTable()
     department_table.FILE_PATH = "test.csv"
     department_table.insert("1,Engineering")
-    department_table.data = []
+
+    loaded_table = DepartmentTable()
+    loaded_table.FILE_PATH = "test.csv"
+    loaded_table.load()
+    assert loaded_table.rows == [{"id": 1, "department_name": "Engineering"}]
+
+    with pytest.raises(ValueError):
+        loaded_table.insert("1,Marketing")
+
+    os.remove("test.csv")
+
+
+def test_save_method(database):
+    database.insert("departments", "1,Engineering")
+    database.insert("departments", "2,Marketing")
+
+    department_table = database.tables["departments"]
+    department_table.save()
     department_table.load()
-    assert department_table.data == [
-        {"id": "1", "department_name": "Engineering"}
+    assert department_table.rows == [
+        {"id": 1, "department_name": "Engineering"},
+        {"id": 2, "department_name": "Marketing"},
+    ]
+
+
+def test_load_method_with_invalid_file(temp_department_file):
+    department_table = DepartmentTable()
+    department_table.FILE_PATH = temp_department_file
+
+    department_table.load()
+    assert department_table.rows == []
+
+    with open(temp_department_file, "w") as f:
+        f.write("id,department_name\r\n")
+
+    department_table.load()
+    assert department_table.rows == []
+
+    with open(temp_department_file, "w") as f:
+        f.write("id,name\n1,Engineering\n")
+
+    with pytest.raises(ValueError):
+        department_table.load()
+
+    with open(temp_department_file, "w") as f:
+        f.write("id,department_name\n1,Engineering,extra\n")
+
+    with pytest.raises(ValueError):
+        department_table.load()
+
+    with open(temp_department_file, "w") as f:
+        f.write("id,department_name\n99999999999999999999,Engineering\n")
+
+    with pytest.raises(ValueError):
+        department_table.load()
+
+    with open(temp_department_file, "w") as f:
+        f.write("id,department_name\n1,Engineering\n\n")
+
+    department_table.load()
+    assert department_table.rows == [
+        {"id": 1, "department_name": "Engineering"}
+    ]
+
+    with open(temp_department_file, "w") as f:
+        f.write('id,department_name\n1,"Research, Development"\n\n')
+
+    department_table.load()
+    assert department_table.rows == [
+        {"id": 1, "department_name": "Research, Development"}
+    ]
+
+
+def test_load_method_with_quoted_fields(temp_department_file):
+    with open(temp_department_file, "w") as f:
+        f.write('id,department_name\r\n1,"Research, Development"\r\n')
+
+    department_table = DepartmentTable()
+    department_table.FILE_PATH = temp_department_file
+    department_table.load()
+    assert department_table.rows == [
+        {"id": 1, "department_name": "Research, Development"}
     ]
-    os.remove("test.csv")